@@ -1,7 +1,13 @@
+import logging
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils import deadline
+
+log = logging.getLogger(__name__)
+
 
 class General(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -9,7 +15,7 @@ class General(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        print("  Ready")
+        log.info("Ready")
 
     # command !ping
     @commands.command()
@@ -37,6 +43,28 @@ class General(commands.Cog):
         embed.set_footer(text="Licenciatura em Engenharia Física e Computacional")
         await interaction.response.send_message(embed=embed)
 
+    # command /deadline-stats
+    @app_commands.command(
+        name="deadline-stats",
+        description="Mostra quantas vezes cada comando precisou de ser adiado",
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def deadline_stats(self, interaction: discord.Interaction):
+        embed = discord.Embed(title="⏱️  Respostas adiadas", color=0x5865F2)
+        if not deadline.invocations:
+            embed.description = "Ainda não foi usado nenhum comando monitorizado."
+        for name, total in deadline.invocations.most_common(25):
+            deferred = deadline.deferrals[name]
+            embed.add_field(
+                name=f"/{name}",
+                value=f"{deferred}/{total} ({deferred / total:.0%})",
+                inline=True,
+            )
+        embed.set_footer(
+            text=f"Limite de {deadline.DEFAULT_BUDGET:g}s antes de adiar a resposta"
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(General(bot))
@@ -2,8 +2,11 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.deadline import guarded, responder
+
 EMBED_COLOR = 0x5865F2  # Discord blurple
 DEFAULT_COG_EMOJI = "📦"
+HELP_SELECT_ID = "help:select"  # fixed so the menu keeps working after restarts
 
 
 def get_cog_emoji(cog: commands.Cog) -> str:
@@ -37,6 +40,7 @@ class HelpSelect(discord.ui.Select):
             )
 
         super().__init__(
+            custom_id=HELP_SELECT_ID,
             placeholder="Escolhe um módulo para ver os seus comandos...",
             options=options,
         )
@@ -95,23 +99,21 @@ class HelpSelect(discord.ui.Select):
             )
 
         embed.set_footer(text="Usa o dropdown para explorar outros módulos.")
-        await interaction.response.edit_message(embed=embed, view=self.view)
+        # Components are left untouched, the dropdown stays as it was
+        await interaction.response.edit_message(embed=embed)
 
 
 class HelpView(discord.ui.View):
+    """Persistent help menu.
+
+    One instance is registered with `bot.add_view` and routes every help
+    dropdown by custom_id. Messages are sent with a stopped copy, which the
+    library renders but doesn't track, so nothing is kept per invocation.
+    """
+
     def __init__(self, bot: commands.Bot):
-        super().__init__(timeout=180)
+        super().__init__(timeout=None)
         self.add_item(HelpSelect(bot))
-        self.message: discord.Message | None = None
-
-    async def on_timeout(self):
-        for item in self.children:
-            item.disabled = True
-        if self.message:
-            try:
-                await self.message.edit(view=self)
-            except discord.NotFound:
-                pass
 
 
 class Help(commands.Cog):
@@ -122,20 +124,36 @@ class Help(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.bot.remove_command("help")
+        self._router = HelpView(bot)
+        self._menu: HelpView | None = None
+        self._menu_cogs: tuple[str, ...] = ()
+
+    async def cog_load(self):
+        self.bot.add_view(self._router)
+
+    async def cog_unload(self):
+        self._router.stop()
+
+    def _get_menu(self) -> HelpView:
+        # Rebuilt only when the set of loaded cogs changes
+        cogs = tuple(self.bot.cogs)
+        if self._menu is None or cogs != self._menu_cogs:
+            self._menu = HelpView(self.bot)
+            self._menu.stop()
+            self._menu_cogs = cogs
+        return self._menu
 
     @app_commands.command(name="help", description="Vê todos os comandos disponíveis")
+    @guarded()
     async def help_slash(self, interaction: discord.Interaction):
         embed = self._build_overview()
-        view = HelpView(self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        view.message = await interaction.original_response()
+        await responder(interaction)(embed=embed, view=self._get_menu())
 
     @commands.command(name="help")
     async def help_prefix(self, ctx: commands.Context):
         """Vê todos os comandos disponíveis."""
         embed = self._build_overview()
-        view = HelpView(self.bot)
-        view.message = await ctx.send(embed=embed, view=view)
+        await ctx.send(embed=embed, view=self._get_menu())
 
     def _build_overview(self) -> discord.Embed:
         embed = discord.Embed(
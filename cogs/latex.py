@@ -1,9 +1,84 @@
+"""
+Latex Cog — Renders LaTeX expressions as images.
+
+Features:
+    - /latex and !latex commands
+    - Opt-in per-channel auto-rendering of inline $...$ and $$...$$ formulas
+
+Auto-render channels are stored in data/latex_config.json.
+"""
+
+import json
+import re
+import time
 import urllib.parse
+from collections import OrderedDict
+from pathlib import Path
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.deadline import guarded, responder
+from utils.ratelimit import app_limit, prefix_limit
+
+CONFIG_FILE = Path("data") / "latex_config.json"
+MAX_INLINE_EXPRESSIONS = 3  # embeds per auto-render reply
+THROTTLE_SECONDS = 5.0  # minimum gap between auto-renders in one channel
+TRACKED_MESSAGES = 500  # messages remembered to handle edits
+
+# $$display$$ or $inline$. Inline math must hug its delimiters and the closing
+# $ can't be followed by a digit, so "custa $5 ou $10" isn't treated as math.
+INLINE_MATH = re.compile(
+    r"(?<!\\)\$\$(.+?)\$\$|(?<![\\$])\$(?=\S)([^$\n]+?)(?<=\S)\$(?!\d)",
+    re.DOTALL,
+)
+
+
+def extract_expressions(content: str) -> tuple[str, ...]:
+    # Cheap prefilter, almost every message bails out here
+    if content.count("$") < 2:
+        return ()
+    found = []
+    for match in INLINE_MATH.finditer(content):
+        expression = (match.group(1) or match.group(2)).strip()
+        if expression:
+            found.append(expression)
+            if len(found) == MAX_INLINE_EXPRESSIONS:
+                break
+    return tuple(found)
+
+
+class LatexConfig:
+    """Set of channel ids with auto-rendering enabled, persisted as JSON."""
+
+    __slots__ = ("_path", "channels")
+
+    def __init__(self, path: Path = CONFIG_FILE):
+        self._path = path
+        self.channels: set[int] = self._load()
+
+    def _load(self) -> set[int]:
+        if self._path.exists():
+            with open(self._path, "r") as f:
+                return set(json.load(f).get("auto_channels", []))
+        return set()
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "w") as f:
+            json.dump({"auto_channels": sorted(self.channels)}, f, indent=2)
+
+    def toggle(self, channel_id: int) -> bool:
+        """Flips auto-rendering for a channel and returns the new state."""
+        enabled = channel_id not in self.channels
+        if enabled:
+            self.channels.add(channel_id)
+        else:
+            self.channels.discard(channel_id)
+        self.save()
+        return enabled
+
 
 class Latex(commands.Cog):
     """Renders LaTeX expressions as an image."""
@@ -12,19 +87,50 @@ class Latex(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.config = LatexConfig()
+        self._last_render: dict[int, float] = {}
+        # message id -> (expressions rendered, our reply)
+        self._rendered: OrderedDict[int, tuple[tuple[str, ...], discord.Message]] = (
+            OrderedDict()
+        )
 
     @app_commands.command(name="latex", description="Renderiza uma expressão LaTeX")
     @app_commands.describe(expression="A expressão LaTeX (ex: E = mc^2)")
+    @app_limit("latex")
+    @guarded()
     async def latex_slash(self, interaction: discord.Interaction, expression: str):
         embed = self._build_embed(expression)
-        await interaction.response.send_message(embed=embed)
+        await responder(interaction)(embed=embed)
 
     @commands.command(name="latex")
+    @prefix_limit("latex")
     async def latex_prefix(self, ctx: commands.Context, *, expression: str):
         """Renderiza uma expressão LaTeX. Ex: !latex E = mc^2"""
         embed = self._build_embed(expression)
         await ctx.send(embed=embed)
 
+    @app_commands.command(
+        name="latex-auto",
+        description="Ativa/desativa a renderização automática de $...$ neste canal",
+    )
+    @app_commands.default_permissions(manage_channels=True)
+    @guarded(ephemeral=True)
+    async def latex_auto_slash(self, interaction: discord.Interaction):
+        await responder(interaction)(
+            self._toggle_auto(interaction.channel_id), ephemeral=True
+        )
+
+    @commands.command(name="latex-auto")
+    @commands.has_permissions(manage_channels=True)
+    async def latex_auto_prefix(self, ctx: commands.Context):
+        """Ativa/desativa a renderização automática de $...$ neste canal."""
+        await ctx.send(self._toggle_auto(ctx.channel.id))
+
+    def _toggle_auto(self, channel_id: int) -> str:
+        if self.config.toggle(channel_id):
+            return "Renderização automática de `$...$` **ativada** neste canal."
+        return "Renderização automática de `$...$` **desativada** neste canal."
+
     def _build_embed(self, expression: str) -> discord.Embed:
         # White text on transparent background, 300 DPI
         encoded = urllib.parse.quote(expression)
@@ -38,6 +144,78 @@ class Latex(commands.Cog):
         embed.set_footer(text=expression)
         return embed
 
+    # Inline auto-rendering
+
+    def _should_render(self, message: discord.Message) -> bool:
+        return message.channel.id in self.config.channels and not message.author.bot
+
+    async def _is_command(self, message: discord.Message) -> bool:
+        # Works for any command_prefix form (str, list or callable)
+        return (await self.bot.get_context(message)).prefix is not None
+
+    def _throttled(self, channel_id: int) -> bool:
+        now = time.monotonic()
+        if now - self._last_render.get(channel_id, 0.0) < THROTTLE_SECONDS:
+            return True
+        self._last_render[channel_id] = now
+        return False
+
+    def _remember(
+        self, message_id: int, expressions: tuple[str, ...], reply: discord.Message
+    ):
+        self._rendered[message_id] = (expressions, reply)
+        self._rendered.move_to_end(message_id)
+        if len(self._rendered) > TRACKED_MESSAGES:
+            self._rendered.popitem(last=False)
+
+    async def _reply_rendered(
+        self, message: discord.Message, expressions: tuple[str, ...]
+    ):
+        reply = await message.reply(
+            embeds=[self._build_embed(e) for e in expressions], mention_author=False
+        )
+        self._remember(message.id, expressions, reply)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        if not self._should_render(message):
+            return
+        expressions = extract_expressions(message.content)
+        if not expressions or await self._is_command(message):
+            return
+        if self._throttled(message.channel.id):
+            return
+
+        await self._reply_rendered(message, expressions)
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        if not self._should_render(after):
+            return
+        expressions = extract_expressions(after.content)
+        if expressions and await self._is_command(after):
+            return
+        previous = self._rendered.get(after.id)
+
+        if previous is None:
+            if expressions and not self._throttled(after.channel.id):
+                await self._reply_rendered(after, expressions)
+            return
+
+        old_expressions, reply = previous
+        if expressions == old_expressions:
+            return  # embed unfurls and typo fixes outside the math
+
+        try:
+            if expressions:
+                await reply.edit(embeds=[self._build_embed(e) for e in expressions])
+                self._remember(after.id, expressions, reply)
+            else:
+                await reply.delete()
+                del self._rendered[after.id]
+        except discord.NotFound:
+            self._rendered.pop(after.id, None)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Latex(bot))
@@ -7,13 +7,20 @@ Features:
     - Multiple feed support (add more in FEEDS)
     - Admin commands to configure channel and active feed
     - Deduplication to avoid reposting
+    - Per-user keyword alerts delivered by DM
+    - Near-duplicate collapsing of stories covered by several feeds
 
 Configuration is stored in data/news_config.json and persists across restarts.
+Keyword subscriptions are stored in data/news_alerts.json.
 """
 
+import asyncio
 import json
+import logging
 import re
+from collections import OrderedDict
 from datetime import time
+from functools import partial
 from pathlib import Path
 from typing import Callable, Coroutine, Optional
 
@@ -22,6 +29,13 @@ import feedparser
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from utils.deadline import guarded, responder
+from utils.dedup import NearDuplicateIndex
+from utils.keywords import KeywordMatcher, normalize
+from utils.ratelimit import app_limit, prefix_limit
+
+log = logging.getLogger(__name__)
+
 # Feed Registry, add new feeds here and they just work
 
 FEEDS: dict[str, dict] = {
@@ -58,6 +72,16 @@ DAILY_POST_TIME = time(hour=9, minute=0)  # 09:00 UTC
 MAX_SUMMARY_LENGTH = 300
 MAX_ARTICLES = 5
 
+ALERTS_FILE = CONFIG_DIR / "news_alerts.json"
+INGEST_INTERVAL = 30  # minutes between polls of every feed
+SEEN_HISTORY = 2000  # article URLs remembered to detect new ones
+DUPLICATE_THRESHOLD = 0.25  # estimated similarity at which stories collapse
+MAX_KEYWORDS = 10  # per user
+MAX_KEYWORD_LENGTH = 50
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord limit
+MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Discord limit, summed over all embeds
+MAX_FIELD_LENGTH = 1024  # Discord limit, arXiv author lists can exceed it
+
 # Config persistence
 
 
@@ -104,26 +128,102 @@ class NewsConfig:
         return FEEDS.get(self._data["feed"], FEEDS[DEFAULT_FEED])
 
 
+class AlertSubscriptions:
+    """Per-user keyword subscriptions, persisted to a JSON file.
+
+    Keeps an inverted index (keyword -> user ids) next to the stored mapping
+    so a matched keyword resolves to its subscribers without scanning users.
+    """
+
+    __slots__ = ("_path", "_users", "_by_keyword", "_matcher")
+
+    def __init__(self, path: Path = ALERTS_FILE):
+        self._path = path
+        self._users: dict[int, list[str]] = self._load()
+        self._by_keyword: dict[str, set[int]] = {}
+        for user_id, keywords in self._users.items():
+            for keyword in keywords:
+                self._by_keyword.setdefault(keyword, set()).add(user_id)
+        self._matcher: Optional[KeywordMatcher] = None
+
+    def _load(self) -> dict[int, list[str]]:
+        if self._path.exists():
+            with open(self._path, "r") as f:
+                stored = json.load(f)
+            return {int(uid): kws for uid, kws in stored.get("users", {}).items()}
+        return {}
+
+    def save(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "w") as f:
+            json.dump({"users": self._users}, f, indent=2)
+
+    def keywords_for(self, user_id: int) -> list[str]:
+        return list(self._users.get(user_id, []))
+
+    def add(self, user_id: int, keyword: str) -> bool:
+        keywords = self._users.setdefault(user_id, [])
+        if keyword in keywords:
+            return False
+        keywords.append(keyword)
+        self._by_keyword.setdefault(keyword, set()).add(user_id)
+        self._matcher = None
+        self.save()
+        return True
+
+    def remove(self, user_id: int, keyword: str) -> bool:
+        keywords = self._users.get(user_id, [])
+        if keyword not in keywords:
+            return False
+        keywords.remove(keyword)
+        if not keywords:
+            del self._users[user_id]
+        subscribers = self._by_keyword[keyword]
+        subscribers.discard(user_id)
+        if not subscribers:
+            del self._by_keyword[keyword]
+        self._matcher = None
+        self.save()
+        return True
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        # Rebuilt lazily, only after subscriptions changed
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(self._by_keyword)
+        return self._matcher
+
+    def subscribers(self, keywords: set[str]) -> set[int]:
+        users: set[int] = set()
+        for keyword in keywords:
+            users |= self._by_keyword.get(keyword, set())
+        return users
+
+
 # Article model
 
 
 class Article:
     """Parsed article from an RSS entry."""
 
-    __slots__ = ("title", "url", "summary", "author", "published", "image")
+    __slots__ = ("title", "url", "body", "summary", "author", "published", "image")
 
     def __init__(self, entry: feedparser.FeedParserDict):
         self.title: str = entry.get("title", "Sem título")
         self.url: str = entry.get("link", "")
-        self.summary: str = self._clean_html(entry.get("summary", ""))
+        # Full text for keyword matching, the embed gets the shortened summary
+        self.body: str = self._clean_html(entry.get("summary", ""))
+        self.summary: str = self._shorten(self.body)
         self.author: str = entry.get("author", "")
         self.published: str = entry.get("published", "")
         self.image: Optional[str] = self._extract_image(entry)
 
     @staticmethod
     def _clean_html(text: str) -> str:
-        text = re.sub(r"<[^>]+>", "", text)
-        text = text.strip()
+        return re.sub(r"<[^>]+>", "", text).strip()
+
+    @staticmethod
+    def _shorten(text: str) -> str:
         if len(text) > MAX_SUMMARY_LENGTH:
             text = text[: MAX_SUMMARY_LENGTH - 3] + "..."
         return text
@@ -154,7 +254,10 @@ class Article:
         if self.image:
             embed.set_image(url=self.image)
         if self.author:
-            embed.add_field(name="Autor", value=self.author, inline=True)
+            author = self.author
+            if len(author) > MAX_FIELD_LENGTH:
+                author = author[: MAX_FIELD_LENGTH - 3] + "..."
+            embed.add_field(name="Autor", value=author, inline=True)
         if self.published:
             embed.add_field(name="Publicado", value=self.published, inline=True)
         if footer:
@@ -174,17 +277,24 @@ class News(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.config = NewsConfig()
+        self.alerts = AlertSubscriptions()
+        self._seen_urls: OrderedDict[str, None] = OrderedDict()
+        self._stories = NearDuplicateIndex(DUPLICATE_THRESHOLD, SEEN_HISTORY)
+        self._primed = False
 
     async def cog_load(self):
         self.daily_news.start()
+        self.ingest_feeds.start()
 
     async def cog_unload(self):
         self.daily_news.cancel()
+        self.ingest_feeds.cancel()
 
     # Feed helpers
 
     @staticmethod
-    def fetch_articles(feed_url: str, limit: int = 5) -> list[Article]:
+    def fetch_articles(feed_url: str, limit: Optional[int] = 5) -> list[Article]:
+        # limit=None reads the whole feed
         feed = feedparser.parse(feed_url)
         return [Article(entry) for entry in feed.entries[:limit]]
 
@@ -193,7 +303,7 @@ class News(commands.Cog):
     async def _cmd_news(self, send: SendFunc, count: int = 1):
         count = max(1, min(MAX_ARTICLES, count))
         feed = self.config.active_feed
-        articles = self.fetch_articles(feed["url"], limit=count)
+        articles = await asyncio.to_thread(self.fetch_articles, feed["url"], count)
 
         if not articles:
             await send("Não consegui obter artigos de momento. Tenta mais tarde.")
@@ -281,10 +391,49 @@ class News(commands.Cog):
             )
         await send(embed=embed)
 
+    async def _cmd_alert_add(self, send: SendFunc, user_id: int, keyword: str):
+        keyword = normalize(keyword)
+        if not keyword or len(keyword) > MAX_KEYWORD_LENGTH:
+            await send(
+                f"A palavra-chave deve ter entre 1 e {MAX_KEYWORD_LENGTH} caracteres."
+            )
+            return
+        if len(self.alerts.keywords_for(user_id)) >= MAX_KEYWORDS:
+            await send(f"Já tens o máximo de {MAX_KEYWORDS} palavras-chave.")
+            return
+
+        if self.alerts.add(user_id, keyword):
+            await send(
+                f"Vais receber uma DM quando sair um artigo sobre **{keyword}**."
+            )
+        else:
+            await send(f"Já estás a seguir **{keyword}**.")
+
+    async def _cmd_alert_remove(self, send: SendFunc, user_id: int, keyword: str):
+        keyword = normalize(keyword)
+        if self.alerts.remove(user_id, keyword):
+            await send(f"Deixaste de seguir **{keyword}**.")
+        else:
+            await send(f"Não estavas a seguir **{keyword}**.")
+
+    async def _cmd_alert_list(self, send: SendFunc, user_id: int):
+        keywords = self.alerts.keywords_for(user_id)
+        if not keywords:
+            await send("Não segues nenhuma palavra-chave. Usa `/news-alert-add`.")
+            return
+        embed = discord.Embed(
+            title="🔔  Os teus alertas",
+            description=", ".join(f"`{k}`" for k in keywords),
+            color=0x5865F2,
+        )
+        embed.set_footer(text=f"{len(keywords)}/{MAX_KEYWORDS} palavras-chave")
+        await send(embed=embed)
+
     # Slash commands
 
     @app_commands.command(name="news", description="Mostra os artigos mais recentes")
     @app_commands.describe(count="Número de artigos a mostrar (1–5)")
+    @app_limit("news")
     async def news_slash(self, interaction: discord.Interaction, count: int = 1):
         await interaction.response.defer()
         await self._cmd_news(interaction.followup.send, count)
@@ -294,15 +443,17 @@ class News(commands.Cog):
     )
     @app_commands.describe(channel="O canal onde as notícias serão publicadas")
     @app_commands.default_permissions(administrator=True)
+    @guarded()
     async def set_channel_slash(
         self, interaction: discord.Interaction, channel: discord.TextChannel
     ):
-        await self._cmd_set_channel(interaction.response.send_message, channel)
+        await self._cmd_set_channel(responder(interaction), channel)
 
     @app_commands.command(name="news-stop", description="Desativa as notícias diárias")
     @app_commands.default_permissions(administrator=True)
+    @guarded()
     async def stop_slash(self, interaction: discord.Interaction):
-        await self._cmd_stop(interaction.response.send_message)
+        await self._cmd_stop(responder(interaction))
 
     @app_commands.command(name="news-feed", description="Muda o feed RSS ativo")
     @app_commands.describe(feed="Nome do feed")
@@ -313,25 +464,55 @@ class News(commands.Cog):
         ]
     )
     @app_commands.default_permissions(administrator=True)
+    @guarded()
     async def set_feed_slash(
         self, interaction: discord.Interaction, feed: app_commands.Choice[str]
     ):
-        await self._cmd_set_feed(interaction.response.send_message, feed.value)
+        await self._cmd_set_feed(responder(interaction), feed.value)
 
     @app_commands.command(
         name="news-status", description="Mostra a configuração atual das notícias"
     )
     @app_commands.default_permissions(administrator=True)
+    @guarded()
     async def status_slash(self, interaction: discord.Interaction):
-        await self._cmd_status(interaction.response.send_message)
+        await self._cmd_status(responder(interaction))
 
     @app_commands.command(name="feeds", description="Lista todos os feeds disponíveis")
+    @guarded()
     async def feeds_slash(self, interaction: discord.Interaction):
-        await self._cmd_feeds(interaction.response.send_message)
+        await self._cmd_feeds(responder(interaction))
+
+    @app_commands.command(
+        name="news-alert-add", description="Recebe uma DM sobre artigos de um tema"
+    )
+    @app_commands.describe(keyword="Palavra-chave (ex: tokamak, lattice QCD)")
+    @guarded(ephemeral=True)
+    async def alert_add_slash(self, interaction: discord.Interaction, keyword: str):
+        send = partial(responder(interaction), ephemeral=True)
+        await self._cmd_alert_add(send, interaction.user.id, keyword)
+
+    @app_commands.command(
+        name="news-alert-remove", description="Deixa de seguir uma palavra-chave"
+    )
+    @app_commands.describe(keyword="Palavra-chave a remover")
+    @guarded(ephemeral=True)
+    async def alert_remove_slash(self, interaction: discord.Interaction, keyword: str):
+        send = partial(responder(interaction), ephemeral=True)
+        await self._cmd_alert_remove(send, interaction.user.id, keyword)
+
+    @app_commands.command(
+        name="news-alerts", description="Lista as palavras-chave que segues"
+    )
+    @guarded(ephemeral=True)
+    async def alert_list_slash(self, interaction: discord.Interaction):
+        send = partial(responder(interaction), ephemeral=True)
+        await self._cmd_alert_list(send, interaction.user.id)
 
     # Prefix commands
 
     @commands.command(name="news")
+    @prefix_limit("news")
     async def news_prefix(self, ctx: commands.Context, count: int = 1):
         """Mostra os artigos mais recentes."""
         await self._cmd_news(ctx.send, count)
@@ -367,6 +548,21 @@ class News(commands.Cog):
         """Lista todos os feeds disponíveis."""
         await self._cmd_feeds(ctx.send)
 
+    @commands.command(name="news-alert-add")
+    async def alert_add_prefix(self, ctx: commands.Context, *, keyword: str):
+        """Recebe uma DM sobre artigos de um tema. Ex: !news-alert-add tokamak"""
+        await self._cmd_alert_add(ctx.send, ctx.author.id, keyword)
+
+    @commands.command(name="news-alert-remove")
+    async def alert_remove_prefix(self, ctx: commands.Context, *, keyword: str):
+        """Deixa de seguir uma palavra-chave."""
+        await self._cmd_alert_remove(ctx.send, ctx.author.id, keyword)
+
+    @commands.command(name="news-alerts")
+    async def alert_list_prefix(self, ctx: commands.Context):
+        """Lista as palavras-chave que segues."""
+        await self._cmd_alert_list(ctx.send, ctx.author.id)
+
     # Daily auto-post
 
     @tasks.loop(time=DAILY_POST_TIME)
@@ -380,7 +576,7 @@ class News(commands.Cog):
             return
 
         feed = self.config.active_feed
-        articles = self.fetch_articles(feed["url"], limit=1)
+        articles = await asyncio.to_thread(self.fetch_articles, feed["url"], 1)
         if not articles:
             return
 
@@ -397,6 +593,115 @@ class News(commands.Cog):
     async def before_daily_news(self):
         await self.bot.wait_until_ready()
 
+    # Feed ingestion and keyword alerts
+
+    def _is_new(self, article: Article) -> bool:
+        if not article.url:
+            return False
+        if article.url in self._seen_urls:
+            # Still on the feed, keep it from aging out of the history
+            self._seen_urls.move_to_end(article.url)
+            return False
+        self._seen_urls[article.url] = None
+        if len(self._seen_urls) > SEEN_HISTORY:
+            self._seen_urls.popitem(last=False)
+        # Same story from another feed (or a re-post under a new URL)
+        text = f"{article.title}\n{article.summary}"
+        return self._stories.add(article.url, text) is None
+
+    @tasks.loop(minutes=INGEST_INTERVAL)
+    async def ingest_feeds(self):
+        fresh: list[tuple[Article, dict]] = []
+        for feed in FEEDS.values():
+            try:
+                # feedparser blocks on the download, keep it off the event loop.
+                # Read every entry: arXiv posts hundreds a day and _is_new
+                # already filters out the ones seen on earlier polls
+                articles = await asyncio.to_thread(
+                    self.fetch_articles, feed["url"], None
+                )
+            except Exception:
+                # One broken feed must not stop the loop for the others
+                log.exception("Failed to ingest feed %s", feed["name"])
+                continue
+            fresh.extend((a, feed) for a in articles if self._is_new(a))
+
+        # The first poll only fills the history, otherwise every restart
+        # would re-announce whatever is currently on the feeds
+        if not self._primed:
+            self._primed = True
+            return
+
+        await self._dispatch_alerts(fresh)
+
+    async def _dispatch_alerts(self, articles: list[tuple[Article, dict]]):
+        matcher = self.alerts.matcher
+        if not matcher or not articles:
+            return
+
+        # One automaton pass per article, then group matches by user
+        inbox: dict[int, list[discord.Embed]] = {}
+        for article, feed in articles:
+            keywords = matcher.search(f"{article.title}\n{article.body}")
+            if not keywords:
+                continue
+            for user_id in self.alerts.subscribers(keywords):
+                mine = keywords.intersection(self.alerts.keywords_for(user_id))
+                footer = "🔔 " + ", ".join(sorted(mine))
+                inbox.setdefault(user_id, []).append(
+                    article.to_embed(feed, footer=footer)
+                )
+
+        for user_id, embeds in inbox.items():
+            await self._deliver(user_id, embeds)
+
+    @staticmethod
+    def _batch_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+        """Groups embeds within Discord's per-message count and size limits."""
+        batches: list[list[discord.Embed]] = []
+        batch: list[discord.Embed] = []
+        size = 0
+        for embed in embeds:
+            length = len(embed)
+            if batch and (
+                len(batch) == MAX_EMBEDS_PER_MESSAGE
+                or size + length > MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(embed)
+            size += length
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _deliver(self, user_id: int, embeds: list[discord.Embed]):
+        user = self.bot.get_user(user_id)
+        try:
+            if user is None:
+                user = await self.bot.fetch_user(user_id)
+            for i, batch in enumerate(self._batch_embeds(embeds)):
+                await user.send(
+                    content="📰 Novos artigos sobre os teus temas:" if i == 0 else None,
+                    embeds=batch,
+                )
+        except (discord.Forbidden, discord.NotFound):
+            # DMs closed or account gone, nothing useful to do
+            pass
+        except discord.HTTPException:
+            # Don't let one failed DM cut off everyone after this user
+            log.exception("Failed to deliver news alerts to user %s", user_id)
+
+    @ingest_feeds.before_loop
+    async def before_ingest_feeds(self):
+        await self.bot.wait_until_ready()
+
+    @ingest_feeds.error
+    async def ingest_feeds_error(self, error: BaseException):
+        # tasks.loop stops on an unhandled error, bring it back for the next poll
+        log.error("News ingestion failed", exc_info=error)
+        self.ingest_feeds.restart()
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(News(bot))
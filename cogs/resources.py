@@ -1,6 +1,16 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import aiohttp
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
+
+from utils.deadline import guarded, responder
+
+log = logging.getLogger(__name__)
 
 RESOURCES = {
     "Geral": {
@@ -21,10 +31,131 @@ RESOURCES = {
     },
 }
 
+# Link health checks
+CHECK_INTERVAL = 50  # minutes between sweeps, shorter than CACHE_TTL
+CACHE_TTL = 60 * 60  # seconds a result is considered fresh
+MAX_CONCURRENCY = 20  # requests in flight overall
+PER_HOST_LIMIT = 2  # requests in flight per host, be polite to uma.pt
+REQUEST_TIMEOUT = 10  # seconds
+MAX_FIELD_LENGTH = 1024  # Discord limit
+USER_AGENT = "lefc_bot link checker (+https://github.com/igp183/lefc_bot)"
+
+
+class LinkStatus:
+    """Result of probing a single URL."""
+
+    __slots__ = ("url", "status", "error", "elapsed_ms", "checked_at")
+
+    def __init__(
+        self,
+        url: str,
+        status: Optional[int] = None,
+        error: str = "",
+        elapsed_ms: int = 0,
+    ):
+        self.url = url
+        self.status = status
+        self.error = error
+        self.elapsed_ms = elapsed_ms
+        self.checked_at = time.monotonic()
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self.checked_at < CACHE_TTL
+
+    def describe(self) -> str:
+        outcome = f"HTTP {self.status}" if self.status else self.error
+        return f"{outcome} · {self.elapsed_ms} ms"
+
+
+class LinkChecker:
+    """Probes URLs concurrently over one pooled session, caching results."""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._limit = asyncio.Semaphore(MAX_CONCURRENCY)
+        self._cache: dict[str, LinkStatus] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENCY, limit_per_host=PER_HOST_LIMIT, ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    async def close(self) -> None:
+        if self._session:
+            await self._session.close()
+
+    async def _probe(self, url: str) -> LinkStatus:
+        async with self._limit:
+            # Timed inside the semaphore so queueing doesn't count as latency
+            start = time.perf_counter()
+            try:
+                # Some servers reject HEAD, so confirm failures with a GET
+                async with self._session.head(url, allow_redirects=True) as resp:
+                    status = resp.status
+                if status >= 400:
+                    async with self._session.get(url, allow_redirects=True) as resp:
+                        status = resp.status
+                error = ""
+            except asyncio.TimeoutError:
+                status, error = None, "Timeout"
+            except aiohttp.ClientError as e:
+                status, error = None, type(e).__name__
+            elapsed = round((time.perf_counter() - start) * 1000)
+        return LinkStatus(url, status, error, elapsed)
+
+    async def check(self, url: str, refresh: bool = False) -> LinkStatus:
+        cached = self._cache.get(url)
+        if cached and cached.fresh and not refresh:
+            return cached
+
+        # Concurrent callers for the same URL share one request
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._probe(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        result = await task
+        self._cache[url] = result
+        return result
+
+    async def check_all(
+        self, urls: list[str], refresh: bool = False
+    ) -> list[LinkStatus]:
+        return await asyncio.gather(*(self.check(u, refresh) for u in urls))
+
 
 class Resources(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.checker = LinkChecker()
+
+    async def cog_load(self):
+        await self.checker.start()
+        self.check_links.start()
+
+    async def cog_unload(self):
+        self.check_links.cancel()
+        await self.checker.close()
+
+    @staticmethod
+    def _all_links() -> dict[str, tuple[str, str]]:
+        """Maps each URL to its (category, name)."""
+        return {
+            url: (cat, name)
+            for cat, links in RESOURCES.items()
+            for name, url in links.items()
+        }
 
     @app_commands.command(
         name="resources", description="Mostra links importantes para o curso"
@@ -33,6 +164,7 @@ class Resources(commands.Cog):
     @app_commands.choices(
         category=[app_commands.Choice(name=cat, value=cat) for cat in RESOURCES.keys()]
     )
+    @guarded()
     async def resources(
         self,
         interaction: discord.Interaction,
@@ -47,7 +179,99 @@ class Resources(commands.Cog):
             embed.add_field(name=cat_name, value=link_list, inline=False)
 
         embed.set_footer(text="Queres adicionar algum link? Contribui no GitHub!")
-        await interaction.response.send_message(embed=embed)
+        await responder(interaction)(embed=embed)
+
+    # Link health
+
+    @staticmethod
+    def _broken_lines(
+        broken: list[LinkStatus], links: dict[str, tuple[str, str]]
+    ) -> str:
+        # Whole lines only, a cut in the middle would break the markdown link
+        reserve = len(f"\n…e mais {len(broken)}")
+        lines: list[str] = []
+        size = 0
+        for i, r in enumerate(broken):
+            cat, name = links[r.url]
+            line = f"[{name}]({r.url}) ({cat}) — {r.describe()}"
+            last = i == len(broken) - 1
+            if size + len(line) + (0 if last else reserve) > MAX_FIELD_LENGTH:
+                lines.append(f"…e mais {len(broken) - i}")
+                break
+            lines.append(line)
+            size += len(line) + 1
+        return "\n".join(lines)
+
+    async def _build_report(self, refresh: bool) -> discord.Embed:
+        links = self._all_links()
+        start = time.perf_counter()
+        results = await self.checker.check_all(list(links), refresh=refresh)
+        elapsed = time.perf_counter() - start
+
+        broken = [r for r in results if not r.ok]
+        embed = discord.Embed(
+            title="🔗  Estado dos Links",
+            description=(
+                f"**{len(results) - len(broken)}/{len(results)}** links a funcionar."
+            ),
+            color=0xED4245 if broken else 0x57F287,
+        )
+        if results:
+            slowest = max(results, key=lambda r: r.elapsed_ms)
+            cat, name = links[slowest.url]
+            embed.add_field(
+                name="Mais lento",
+                value=f"[{name}]({slowest.url}) ({cat}) — {slowest.describe()}",
+                inline=False,
+            )
+        if broken:
+            embed.add_field(
+                name="Links com problemas",
+                value=self._broken_lines(broken, links),
+                inline=False,
+            )
+        embed.set_footer(
+            text=f"Verificado em {elapsed:.2f}s · cache de {CACHE_TTL // 60} min"
+        )
+        return embed
+
+    @app_commands.command(
+        name="resources-check",
+        description="Verifica se os links dos recursos funcionam",
+    )
+    @app_commands.describe(refresh="Ignora a cache e volta a verificar todos os links")
+    @app_commands.default_permissions(administrator=True)
+    @guarded(ephemeral=True)
+    async def resources_check_slash(
+        self, interaction: discord.Interaction, refresh: bool = False
+    ):
+        embed = await self._build_report(refresh)
+        await responder(interaction)(embed=embed, ephemeral=True)
+
+    @commands.command(name="resources-check")
+    @commands.has_permissions(administrator=True)
+    async def resources_check_prefix(
+        self, ctx: commands.Context, refresh: bool = False
+    ):
+        """Verifica se os links dos recursos funcionam."""
+        async with ctx.typing():
+            embed = await self._build_report(refresh)
+        await ctx.send(embed=embed)
+
+    @tasks.loop(minutes=CHECK_INTERVAL)
+    async def check_links(self):
+        # Keeps the cache warm so the admin report is usually instant
+        await self.checker.check_all(list(self._all_links()), refresh=True)
+
+    @check_links.before_loop
+    async def before_check_links(self):
+        await self.bot.wait_until_ready()
+
+    @check_links.error
+    async def check_links_error(self, error: BaseException):
+        # tasks.loop stops on an unhandled error, bring it back for the next sweep
+        log.error("Link check sweep failed", exc_info=error)
+        self.check_links.restart()
 
 
 async def setup(bot: commands.Bot):
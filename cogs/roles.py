@@ -1,7 +1,12 @@
+from collections import Counter
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from utils.deadline import guarded, responder
+from utils.ratelimit import app_limit
+
 ASSIGNABLE_ROLES = [
     "1º Ano",
     "2º Ano",
@@ -12,6 +17,7 @@ ASSIGNABLE_ROLES = [
     "Doutoramento",
     "LEFC",
 ]
+ROLE_SELECT_ID = "roles:select"
 
 
 class RoleSelect(discord.ui.Select):
@@ -20,6 +26,7 @@ class RoleSelect(discord.ui.Select):
             discord.SelectOption(label=role, value=role) for role in ASSIGNABLE_ROLES
         ]
         super().__init__(
+            custom_id=ROLE_SELECT_ID,
             placeholder="Escolhe o role que queres...",
             min_values=0,
             max_values=len(options),
@@ -58,6 +65,8 @@ class RoleSelect(discord.ui.Select):
 
 
 class RoleView(discord.ui.View):
+    """Persistent role menu, routed by custom_id (see HelpView)."""
+
     def __init__(self):
         super().__init__(timeout=None)
         self.add_item(RoleSelect())
@@ -66,13 +75,109 @@ class RoleView(discord.ui.View):
 class Roles(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._router = RoleView()
+        # Stopped views are rendered but not tracked by the library
+        self._menu = RoleView()
+        self._menu.stop()
+        # guild id -> role id -> member count, kept current from member events
+        self._role_counts: dict[int, Counter[int]] = {}
+
+    async def cog_load(self):
+        self.bot.add_view(self._router)
+
+    async def cog_unload(self):
+        self._router.stop()
 
     @app_commands.command(name="roles", description="Escolhe o role que queres...")
+    @app_limit("roles")
+    @guarded(ephemeral=True)
     async def roles(self, interaction: discord.Interaction):
-        view = RoleView()
-        await interaction.response.send_message(
-            "Escolhe os roles:", view=view, ephemeral=True
+        await responder(interaction)(
+            "Escolhe os roles:", view=self._menu, ephemeral=True
+        )
+
+    @app_commands.command(
+        name="roles-stats", description="Mostra quantos membros têm cada role"
+    )
+    @app_commands.guild_only()
+    @guarded()
+    async def roles_stats(self, interaction: discord.Interaction):
+        counts = self._role_counts.get(interaction.guild_id)
+        if counts is None:
+            await responder(interaction)(
+                "As estatísticas ainda estão a ser calculadas, tenta daqui a pouco.",
+                ephemeral=True,
+            )
+            return
+
+        lines = []
+        for role_name in ASSIGNABLE_ROLES:
+            role = discord.utils.get(interaction.guild.roles, name=role_name)
+            if role is not None:
+                lines.append(f"{role.mention}: **{counts[role.id]}**")
+
+        embed = discord.Embed(
+            title="📊  Roles",
+            description="\n".join(lines) or "Nenhum role configurado neste servidor.",
+            color=0x5865F2,
         )
+        await responder(interaction)(embed=embed)
+
+    # Role statistics
+
+    @staticmethod
+    def _member_roles(member: discord.Member) -> set[int]:
+        return {role.id for role in member.roles if not role.is_default()}
+
+    def _reconcile(self, guild: discord.Guild):
+        # Full member scan, events keep the counts current until the next one
+        counts: Counter[int] = Counter()
+        for member in guild.members:
+            counts.update(self._member_roles(member))
+        self._role_counts[guild.id] = counts
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # A repeated on_ready means a fresh session (not a resume), so member
+        # events from the gap were lost and every guild is counted again
+        for guild in self.bot.guilds:
+            self._reconcile(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self._reconcile(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._role_counts.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        counts = self._role_counts.get(member.guild.id)
+        if counts is not None:
+            counts.update(self._member_roles(member))
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        counts = self._role_counts.get(member.guild.id)
+        if counts is not None:
+            counts.subtract(self._member_roles(member))
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        counts = self._role_counts.get(after.guild.id)
+        if counts is None:
+            return
+        old, new = self._member_roles(before), self._member_roles(after)
+        if old != new:
+            counts.update(new - old)
+            counts.subtract(old - new)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        counts = self._role_counts.get(role.guild.id)
+        if counts is not None:
+            counts.pop(role.id, None)
 
 
 async def setup(bot: commands.Bot):
@@ -1,12 +1,20 @@
 import asyncio
+import logging
 import os
 
 import discord
+from discord import app_commands
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from utils import ratelimit  # noqa: E402
+from utils.log import setup_logging  # noqa: E402, reads LOG_* from .env
+
+log = logging.getLogger("bot")
+command_log = logging.getLogger("bot.commands")
+
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
@@ -47,15 +55,15 @@ async def load_cogs():
         if filename.endswith(".py") and filename != "__init__.py":
             try:
                 await bot.load_extension(f"cogs.{filename[:-3]}")
-                print(f"  Loaded cog: {filename[:-3]}")
-            except Exception as e:
-                print(f"  Failed to load {filename[:-3]}: {e}")
+                log.info("Loaded cog: %s", filename[:-3])
+            except Exception:
+                log.exception("Failed to load %s", filename[:-3])
 
 
 @bot.event
 async def on_ready():
-    print(f"Logged in as {bot.user} (ID: {bot.user.id})")
-    print(f"Connected to {len(bot.guilds)} server(s)")
+    log.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
+    log.info("Connected to %d server(s)", len(bot.guilds))
 
     # Start rotating status
     if not rotate_status.is_running():
@@ -64,16 +72,78 @@ async def on_ready():
     # Sync slash commands
     try:
         synced = await bot.tree.sync()
-        print(f"Synced {len(synced)} slash command(s)")
-    except Exception as e:
-        print(f"Failed to sync commands: {e}")
+        log.info("Synced %d slash command(s)", len(synced))
+    except Exception:
+        log.exception("Failed to sync commands")
+
+
+# Command telemetry, latency measured from when Discord created the event
+def _latency_ms(created_at) -> int:
+    return round((discord.utils.utcnow() - created_at).total_seconds() * 1000)
+
+
+@bot.event
+async def on_app_command_completion(
+    interaction: discord.Interaction, command: app_commands.Command
+):
+    command_log.info(
+        "app command completed",
+        extra={
+            "command": command.qualified_name,
+            "guild": interaction.guild_id,
+            "channel": interaction.channel_id,
+            "user": interaction.user.id,
+            "latency_ms": _latency_ms(interaction.created_at),
+        },
+    )
+
+
+@bot.event
+async def on_command_completion(ctx: commands.Context):
+    command_log.info(
+        "prefix command completed",
+        extra={
+            "command": ctx.command.qualified_name,
+            "guild": ctx.guild.id if ctx.guild else None,
+            "channel": ctx.channel.id,
+            "user": ctx.author.id,
+            "latency_ms": _latency_ms(ctx.message.created_at),
+        },
+    )
+
+
+# Error handling, rate limits get a friendly reply, the rest keeps the
+# library's default behavior
+@bot.tree.error
+async def on_app_command_error(
+    interaction: discord.Interaction, error: app_commands.AppCommandError
+):
+    if isinstance(error, ratelimit.SlashRateLimited):
+        if interaction.response.is_done():
+            await interaction.followup.send(str(error), ephemeral=True)
+        else:
+            await interaction.response.send_message(str(error), ephemeral=True)
+        return
+    await app_commands.CommandTree.on_error(bot.tree, interaction, error)
+
+
+@bot.event
+async def on_command_error(ctx: commands.Context, error: commands.CommandError):
+    if isinstance(error, ratelimit.PrefixRateLimited):
+        await ctx.reply(str(error), delete_after=max(5, error.retry_after))
+        return
+    await commands.Bot.on_command_error(bot, ctx, error)
 
 
 # Run
 async def main():
-    async with bot:
-        await load_cogs()
-        await bot.start(os.getenv("DISCORD_TOKEN"))
+    listener = setup_logging()
+    try:
+        async with bot:
+            await load_cogs()
+            await bot.start(os.getenv("DISCORD_TOKEN"))
+    finally:
+        listener.stop()  # flushes whatever is still queued
 
 
 asyncio.run(main())
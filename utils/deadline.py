@@ -0,0 +1,110 @@
+"""
+Interaction deadline guard.
+
+Discord drops an interaction that isn't acknowledged within 3 seconds. Slash
+commands wrapped with `guarded` get a watchdog that defers the interaction
+once it outlives its budget; replies sent through `responder` then go to the
+followup webhook instead of the (already used) initial response.
+
+The watchdog is an event-loop task, so handlers must not block the loop
+(run blocking I/O through `asyncio.to_thread`) or it can't fire in time.
+"""
+
+import asyncio
+import functools
+import logging
+from collections import Counter
+from typing import Callable, Coroutine
+
+import discord
+
+DEFAULT_BUDGET = 2.0  # seconds since Discord created the interaction
+GUARD_KEY = "deadline_guard"
+
+log = logging.getLogger(__name__)
+
+SendFunc = Callable[..., Coroutine]
+
+# Per-command counters, keyed by qualified command name
+invocations: Counter[str] = Counter()
+deferrals: Counter[str] = Counter()
+
+
+class DeadlineGuard:
+    """Serializes the watchdog's defer with the handler's reply."""
+
+    __slots__ = ("interaction", "ephemeral", "deferred", "_lock")
+
+    def __init__(self, interaction: discord.Interaction, ephemeral: bool = False):
+        self.interaction = interaction
+        self.ephemeral = ephemeral
+        self.deferred = False
+        self._lock = asyncio.Lock()
+
+    async def watch(self, budget: float) -> None:
+        # Gateway delay and command checks already used part of the window
+        age = (discord.utils.utcnow() - self.interaction.created_at).total_seconds()
+        await asyncio.sleep(max(0.0, budget - age))
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                await self.interaction.response.defer(
+                    ephemeral=self.ephemeral, thinking=True
+                )
+                self.deferred = True
+
+    async def send(self, *args, **kwargs):
+        async with self._lock:
+            if self.interaction.response.is_done():
+                return await self.interaction.followup.send(*args, **kwargs)
+            return await self.interaction.response.send_message(*args, **kwargs)
+
+
+def guarded(budget: float = DEFAULT_BUDGET, *, ephemeral: bool = False):
+    """Decorates an app command callback with a deadline watchdog.
+
+    Place it directly above the `async def`, under `@app_commands.command`.
+    `ephemeral` should match the command's reply, since a deferred response
+    keeps the visibility chosen at defer time.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = next(
+                a for a in args if isinstance(a, discord.Interaction)
+            )
+            command = interaction.command
+            name = command.qualified_name if command else func.__name__
+
+            guard = DeadlineGuard(interaction, ephemeral)
+            interaction.extras[GUARD_KEY] = guard
+            invocations[name] += 1
+            watchdog = asyncio.create_task(guard.watch(budget))
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                watchdog.cancel()
+                if guard.deferred:
+                    deferrals[name] += 1
+                    log.info(
+                        "app command deferred",
+                        extra={
+                            "command": name,
+                            "guild": interaction.guild_id,
+                            "channel": interaction.channel_id,
+                            "user": interaction.user.id,
+                            "deferred": True,
+                        },
+                    )
+
+        return wrapper
+
+    return decorator
+
+
+def responder(interaction: discord.Interaction) -> SendFunc:
+    """Returns the send function a handler should reply with."""
+    guard = interaction.extras.get(GUARD_KEY)
+    if guard is None:
+        return interaction.response.send_message
+    return guard.send
@@ -0,0 +1,151 @@
+"""
+Near-duplicate text detection (MinHash + LSH).
+
+Texts are reduced to their set of content words and summarized by a MinHash
+signature; signatures are split into bands and bucketed, so a lookup is
+O(bands) dictionary probes plus a check of each candidate. Candidates are
+stored texts that share a band, which for unrelated stories is rare but still
+grows linearly with history size.
+
+Outlets rewrite each other's stories, so word n-grams rarely survive between
+feeds; single words with stopwords dropped and plurals folded do.
+"""
+
+import hashlib
+import re
+import struct
+from typing import Hashable, Optional
+
+_WORD = re.compile(r"\w+")
+
+SHINGLE_SIZE = 1
+NUM_PERM = 128  # hash values per signature, used for the similarity estimate
+# 42 bands of 3 rows put the LSH knee near 0.29, just above the 0.25 threshold
+# News uses, so unrelated stories rarely become candidates as history grows
+BANDS = 42
+ROWS = 3
+
+STOPWORDS = frozenset(
+    "a about above after again against all also am an and any are as at be "
+    "because been before being below between both but by can could did do does "
+    "doing down during each few for from further had has have having he her "
+    "here hers him his how i if in into is it its itself just may me might more "
+    "most much must my new no nor not now of off on once only or other our ours "
+    "out over own same she should show shows so some such than that the their "
+    "them then there these they this those through to too under until up upon "
+    "us use used using very was we were what when where which while who whom "
+    "why will with within without would you your".split()
+)
+
+
+def _fold(word: str) -> str:
+    # Crude plural folding, "pulsars" and "pulsar" are the same word here
+    return word[:-1] if len(word) > 4 and word.endswith("s") else word
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    words = [
+        _fold(w) for w in _WORD.findall(text.casefold()) if w not in STOPWORDS
+    ]
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """Remembers the last `capacity` texts and flags new near-duplicates.
+
+    `threshold` is the estimated Jaccard similarity between shingle sets
+    above which two texts count as the same story.
+    """
+
+    __slots__ = (
+        "threshold",
+        "capacity",
+        "_seed",
+        "_struct",
+        "_rows",
+        "_buckets",
+        "_entries",
+    )
+
+    def __init__(
+        self,
+        threshold: float = 0.25,
+        capacity: int = 2000,
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+        rows: int = ROWS,
+        seed: int = 1,
+    ):
+        if bands * rows > num_perm:
+            raise ValueError("bands * rows can't exceed num_perm")
+        self.threshold = threshold
+        self.capacity = capacity
+        self._seed = seed.to_bytes(8, "little")
+        self._struct = struct.Struct(f"<{num_perm}Q")
+        self._rows = rows
+        self._buckets: list[dict[tuple[int, ...], list[Hashable]]] = [
+            {} for _ in range(bands)
+        ]
+        # key -> signature, oldest first for eviction
+        self._entries: dict[Hashable, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _signature(self, text: str) -> Optional[tuple[int, ...]]:
+        # One extendable-output digest gives every shingle num_perm independent
+        # 64-bit hashes; the signature is their column-wise minimum
+        unpack, size = self._struct.unpack, self._struct.size
+        rows = [
+            unpack(hashlib.shake_128(self._seed + s.encode()).digest(size))
+            for s in shingles(text)
+        ]
+        if not rows:
+            return None
+        return tuple(map(min, *rows)) if len(rows) > 1 else rows[0]
+
+    def _bands(self, signature: tuple[int, ...]):
+        rows = self._rows
+        for i, bucket in enumerate(self._buckets):
+            yield bucket, signature[i * rows : (i + 1) * rows]
+
+    def _similarity(self, a: tuple[int, ...], b: tuple[int, ...]) -> float:
+        return sum(map(int.__eq__, a, b)) / len(a)
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """Indexes `text` under `key`, unless it near-duplicates a stored text.
+
+        Returns the key of the earlier text in that case, otherwise None.
+        """
+        signature = self._signature(text)
+        if signature is None:
+            return None
+
+        checked = set()
+        for bucket, band in self._bands(signature):
+            for other in bucket.get(band, ()):
+                if other in checked:
+                    continue
+                checked.add(other)
+                if self._similarity(signature, self._entries[other]) >= self.threshold:
+                    return other
+
+        if key in self._entries:
+            return None
+        self._entries[key] = signature
+        for bucket, band in self._bands(signature):
+            bucket.setdefault(band, []).append(key)
+        if len(self._entries) > self.capacity:
+            self._evict()
+        return None
+
+    def _evict(self) -> None:
+        oldest = next(iter(self._entries))
+        signature = self._entries.pop(oldest)
+        for bucket, band in self._bands(signature):
+            keys = bucket[band]
+            keys.remove(oldest)
+            if not keys:
+                del bucket[band]
@@ -0,0 +1,84 @@
+"""
+Multi-pattern keyword matching (Aho-Corasick).
+
+All keywords are compiled into a single automaton, so scanning a text costs
+O(len(text) + matches) no matter how many keywords are registered.
+"""
+
+from typing import Iterable
+
+
+def normalize(text: str) -> str:
+    """Case-folds and collapses whitespace so "Lattice  QCD" == "lattice qcd"."""
+    return " ".join(text.casefold().split())
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text.
+
+    A keyword only matches at the start of a word ("ion" matches "ionization"
+    but not "fusion"), which keeps short keywords from firing everywhere while
+    still catching plurals.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out")
+
+    def __init__(self, keywords: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+
+        for keyword in keywords:
+            keyword = normalize(keyword)
+            if keyword:
+                self._insert(keyword)
+        self._link()
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def _insert(self, keyword: str) -> None:
+        node = 0
+        for char in keyword:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        if keyword not in self._out[node]:
+            self._out[node] += (keyword,)
+
+    def _link(self) -> None:
+        # Breadth-first so every failure target is resolved before its users
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def search(self, text: str) -> set[str]:
+        """Returns the (normalized) keywords found in `text`."""
+        found: set[str] = set()
+        if not self:
+            return found
+
+        text = normalize(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword in out[node]:
+                start = end - len(keyword) + 1
+                if start == 0 or not text[start - 1].isalnum():
+                    found.add(keyword)
+        return found
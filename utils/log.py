@@ -0,0 +1,140 @@
+"""
+Non-blocking logging setup.
+
+Every logger writes into an in-memory queue; a QueueListener thread drains it
+into the real handlers (stderr and a rotating JSON file), so a slow stdout or
+journald never stalls the event loop.
+
+Structured fields are passed through `extra`, e.g.
+    log.info("app command", extra={"command": "news", "guild": 123,
+                                   "latency_ms": 412})
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+
+LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
+LOG_FILE = "bot.log"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Share of per-command telemetry records kept, one is written per command
+COMMAND_SAMPLE_RATE = float(os.getenv("LOG_COMMAND_SAMPLE_RATE", "0.25"))
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+
+# Fields copied from `extra` into the JSON record when present
+STRUCTURED_FIELDS = (
+    "command",
+    "guild",
+    "channel",
+    "user",
+    "latency_ms",
+    "deferred",
+    "sample_rate",
+)
+
+# Fraction of sub-WARNING records kept per logger (longest prefix wins).
+# A record can override it with extra={"sample_rate": ...}. Kept records carry
+# the rate so counts and latencies can be scaled back up.
+SAMPLE_RATES: dict[str, float] = {
+    "bot.commands": COMMAND_SAMPLE_RATE,
+    "utils.deadline": COMMAND_SAMPLE_RATE,
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SampleFilter(logging.Filter):
+    """Drops a share of high-volume records; warnings and above always pass."""
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        # Longest prefix first so "discord.gateway" beats "discord"
+        self._rates = sorted(rates.items(), key=lambda kv: -len(kv[0]))
+
+    def _rate_for(self, record: logging.LogRecord) -> float:
+        rate = getattr(record, "sample_rate", None)
+        if rate is not None:
+            return rate
+        for prefix, rate in self._rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate_for(record)
+        if rate >= 1.0:
+            return True
+        record.sample_rate = rate
+        return random.random() < rate
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Keeps the traceback separate from the message so it stays a JSON field."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Routes the root logger through a queue. Call `.stop()` on shutdown."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    console = logging.StreamHandler()
+    console.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+    )
+    file = logging.handlers.RotatingFileHandler(
+        LOG_DIR / LOG_FILE,
+        maxBytes=MAX_BYTES,
+        backupCount=BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file.setFormatter(JsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    # Sample before enqueueing so dropped records cost nothing downstream
+    queue_handler.addFilter(SampleFilter(SAMPLE_RATES))
+
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(queue_handler)
+    root.setLevel(LOG_LEVEL)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console, file, respect_handler_level=True
+    )
+    listener.start()
+    return listener
@@ -0,0 +1,130 @@
+"""
+Token-bucket rate limits shared by slash and prefix commands.
+
+Each command can have user, channel and global buckets (see LIMITS). A call
+is only let through when every bucket has a token, and only then are tokens
+taken, so a denied call never drains the other scopes. Buckets live in one
+LRU map with a fixed capacity; an evicted bucket simply starts full again.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+MAX_BUCKETS = 10_000
+
+
+class Limit(NamedTuple):
+    rate: int  # tokens (burst size)
+    per: float  # seconds to refill all of them
+    scope: str  # "user", "channel" or "global"
+
+
+LIMITS: dict[str, tuple[Limit, ...]] = {
+    "news": (
+        Limit(2, 60, "user"),
+        Limit(4, 60, "channel"),
+        Limit(12, 60, "global"),
+    ),
+    "latex": (
+        Limit(5, 30, "user"),
+        Limit(15, 30, "channel"),
+    ),
+    "roles": (Limit(3, 30, "user"),),
+}
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.updated = time.monotonic()
+
+    def refill(self, limit: Limit, now: float) -> None:
+        self.tokens = min(
+            limit.rate, self.tokens + (now - self.updated) * limit.rate / limit.per
+        )
+        self.updated = now
+
+    def retry_after(self, limit: Limit) -> float:
+        return max(0.0, (1 - self.tokens) * limit.per / limit.rate)
+
+
+_buckets: OrderedDict[tuple, TokenBucket] = OrderedDict()
+
+
+def _bucket(key: tuple, limit: Limit) -> TokenBucket:
+    bucket = _buckets.get(key)
+    if bucket is None:
+        bucket = _buckets[key] = TokenBucket(limit.rate)
+        if len(_buckets) > MAX_BUCKETS:
+            _buckets.popitem(last=False)
+    else:
+        _buckets.move_to_end(key)
+    return bucket
+
+
+def acquire(command: str, user_id: int, channel_id: int) -> float:
+    """Takes a token for `command`. Returns 0 on success, else seconds to wait."""
+    ids = {"user": user_id, "channel": channel_id, "global": 0}
+    now = time.monotonic()
+
+    buckets = []
+    wait = 0.0
+    for limit in LIMITS.get(command, ()):
+        bucket = _bucket((command, limit.scope, ids[limit.scope]), limit)
+        bucket.refill(limit, now)
+        wait = max(wait, bucket.retry_after(limit))
+        buckets.append(bucket)
+
+    if wait:
+        return wait
+    for bucket in buckets:
+        bucket.tokens -= 1
+    return 0.0
+
+
+def _message(retry_after: float) -> str:
+    return f"⏳ Calma! Tenta novamente daqui a {math.ceil(retry_after)}s."
+
+
+class SlashRateLimited(app_commands.CheckFailure):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(_message(retry_after))
+
+
+class PrefixRateLimited(commands.CheckFailure):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(_message(retry_after))
+
+
+def app_limit(command: str):
+    """`app_commands.check` applying LIMITS[command] to a slash command."""
+
+    async def predicate(interaction: discord.Interaction) -> bool:
+        wait = acquire(command, interaction.user.id, interaction.channel_id)
+        if wait:
+            raise SlashRateLimited(wait)
+        return True
+
+    return app_commands.check(predicate)
+
+
+def prefix_limit(command: str):
+    """`commands.check` applying LIMITS[command] to a prefix command."""
+
+    async def predicate(ctx: commands.Context) -> bool:
+        wait = acquire(command, ctx.author.id, ctx.channel.id)
+        if wait:
+            raise PrefixRateLimited(wait)
+        return True
+
+    return commands.check(predicate)